@@ -7,29 +7,146 @@ Note: This script expects to be run with the venv python interpreter.
 The install script will update the shebang automatically.
 """
 
+import argparse
+import functools
+import heapq
+import http.client
+import itertools
+import json
+import operator
+import os
+import signal
+import socket
+import stat
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from enum import IntEnum
 from pathlib import Path
 from typing import List, Optional
-import yaml
 
 
-class Severity(Enum):
-    """Issue severity levels with corresponding colors."""
-    OK = ("ok", "\033[0m")  # Default
-    INFO = ("\033[38;5;141m", "\033[0m")  # Purple
-    WARNING = ("\033[38;5;220m", "\033[0m")  # Amber/Yellow
-    CRITICAL = ("\033[38;5;196m", "\033[0m")  # Red
+# Per-user private runtime dir when available, shared temp dir (with uid-suffixed names) otherwise
+RUNTIME_DIR = os.environ.get("XDG_RUNTIME_DIR")
 
-    def __init__(self, color_code, reset_code):
-        self.color = color_code
-        self.reset = reset_code
+# Short-lived result cache so several shells opened in quick succession reuse one set of checks
+CACHE_PATH = (
+    Path(RUNTIME_DIR) / "homelab-health.json" if RUNTIME_DIR
+    else Path(tempfile.gettempdir()) / f"homelab-health-{os.getuid()}.json"
+)
+CACHE_TTL = 5  # seconds, per checker unless overridden by <section>.ttl_seconds
 
+DOCKER_SOCKET = "/var/run/docker.sock"
 
-@dataclass
+# Unit types systemctl recognises in a name, anything else gets ".service" appended
+UNIT_SUFFIXES = (
+    ".service", ".socket", ".target", ".device", ".mount", ".automount",
+    ".swap", ".timer", ".path", ".slice", ".scope",
+)
+
+# Where --daemon serves its latest rendered output
+DAEMON_SOCKET = (
+    Path(RUNTIME_DIR) / "homelab-health.sock" if RUNTIME_DIR
+    else Path(tempfile.gettempdir()) / f"homelab-health-{os.getuid()}.sock"
+)
+DAEMON_INTERVAL = 30  # seconds between checks in --daemon mode
+
+# dataclass(slots=True) needs Python 3.10+, older interpreters just keep the per-instance __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def stream_command(cmd: List[str], timeout: float = 5):
+    """Yield non-empty stdout lines of a command as they arrive.
+
+    The command is killed after timeout seconds and TimeoutExpired is raised once the
+    remaining output has been consumed.
+    """
+    # Own process group, so the timeout also reaches any children holding stdout open
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1, start_new_session=True
+    )
+
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line:
+                yield line
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+        proc.wait()
+
+    # Output cut short by the kill is not a complete listing, fail like subprocess.run(timeout=...)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+
+class Severity(IntEnum):
+    """Issue severity levels, most severe first so they sort as plain ints."""
+    CRITICAL = 0
+    WARNING = 1
+    INFO = 2
+    OK = 3
+
+    @property
+    def color(self) -> str:
+        return _SEV_COLORS[self]
+
+    @property
+    def reset(self) -> str:
+        return _SEV_RESETS[self]
+
+
+_SEV_COLORS = {
+    Severity.CRITICAL: "\033[38;5;196m",  # Red
+    Severity.WARNING: "\033[38;5;220m",  # Amber/Yellow
+    Severity.INFO: "\033[38;5;141m",  # Purple
+    Severity.OK: "ok",  # Default
+}
+_SEV_RESETS = dict.fromkeys(Severity, "\033[0m")
+
+
+# Per-severity (prefix, suffix) for issue lines, built once instead of on every format() call
+_SEV_FORMAT = {
+    severity: (f"{severity.color}{icon} ", severity.reset)
+    for severity, icon in [
+        (Severity.CRITICAL, "✗"),
+        (Severity.WARNING, "⚠"),
+        (Severity.INFO, "ℹ"),
+        (Severity.OK, "✓"),
+    ]
+}
+_DEFAULT_FORMAT = ("• ", "\033[0m")
+
+# Same prefixes/suffixes pre-encoded (suffix with newline) so output lines skip the text encoder
+_SEV_BYTES = {
+    severity: (prefix.encode("utf-8"), suffix.encode("utf-8") + b"\n")
+    for severity, (prefix, suffix) in _SEV_FORMAT.items()
+}
+_DEFAULT_BYTES = (_DEFAULT_FORMAT[0].encode("utf-8"), _DEFAULT_FORMAT[1].encode("utf-8") + b"\n")
+
+_WARN_C, _WARN_R = Severity.WARNING.color, Severity.WARNING.reset
+_INFO_C, _INFO_R = Severity.INFO.color, Severity.INFO.reset
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class HealthIssue:
     """Represents a health check issue."""
     severity: Severity
@@ -39,17 +156,35 @@ class HealthIssue:
 
     def format(self) -> str:
         """Format the issue for display."""
-        icon = {
-            Severity.CRITICAL: "✗",
-            Severity.WARNING: "⚠",
-            Severity.INFO: "ℹ",
-            Severity.OK: "✓",
-        }.get(self.severity, "•")
-
-        return f"{self.severity.color}{icon} {self.category}: {self.name} - {self.message}{self.severity.reset}"
-
-
-@dataclass
+        prefix, suffix = _SEV_FORMAT.get(self.severity, _DEFAULT_FORMAT)
+        return f"{prefix}{self.category}: {self.name} - {self.message}{suffix}"
+
+    def format_bytes(self) -> bytes:
+        """Format the issue as a UTF-8 encoded output line, including the newline."""
+        prefix, suffix = _SEV_BYTES.get(self.severity, _DEFAULT_BYTES)
+        return prefix + f"{self.category}: {self.name} - {self.message}".encode("utf-8") + suffix
+
+    def to_dict(self) -> dict:
+        """Serialize the issue to a JSON-compatible dict."""
+        return {
+            "severity": self.severity.name,
+            "category": self.category,
+            "name": self.name,
+            "message": self.message,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HealthIssue":
+        """Rebuild an issue from the output of to_dict()."""
+        return cls(
+            severity=Severity[data["severity"]],
+            category=data["category"],
+            name=data["name"],
+            message=data["message"],
+        )
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class HealthStats:
     """Statistics from health checks."""
     systemd_running: int = 0
@@ -62,8 +197,18 @@ class HealthStats:
 class HealthChecker(ABC):
     """Base class for health checkers."""
 
+    # Config section and result cache slot used by this checker
+    name: str
+
     def __init__(self, config: dict):
         self.config = config
+        # Cleared by check() when a probe timed out, so its result is not reused from the cache
+        self.cacheable = True
+
+    @property
+    def ttl(self) -> float:
+        """Seconds a cached result of this checker stays fresh."""
+        return self.config.get(self.name, {}).get("ttl_seconds", CACHE_TTL)
 
     @abstractmethod
     def check(self) -> tuple[List[HealthIssue], HealthStats]:
@@ -74,76 +219,145 @@ class HealthChecker(ABC):
 class SystemdChecker(HealthChecker):
     """Checks systemd service health."""
 
+    name = "systemd"
+
     def check(self) -> tuple[List[HealthIssue], HealthStats]:
-        issues = []
-        stats = HealthStats()
         config = self.config.get("systemd", {})
 
-        # Get running services count
         try:
-            result = subprocess.run(
-                ["systemctl", "list-units", "--type=service", "--state=running", "--no-legend"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            stats.systemd_running = len([line for line in result.stdout.strip().split("\n") if line])
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+            from pydbus import SystemBus
+            return self._check_dbus(SystemBus(), config)
+        except ImportError:
+            # pydbus not available, use systemctl
+            pass
+        except Exception:
+            # System bus unreachable or systemd error, use systemctl
             pass
 
-        if config.get("show_all_failed", True):
-            failed_issues = self._check_failed_services()
-            issues.extend(failed_issues)
-            stats.systemd_failed = len(failed_issues)
+        return self._check_systemctl(config)
+
+    def _check_dbus(self, bus, config: dict) -> tuple[List[HealthIssue], HealthStats]:
+        """Query systemd over a single DBus connection instead of forking systemctl."""
+        issues = []
+        stats = HealthStats()
+        manager = bus.get(".systemd1")
 
-        # Check specific services if configured
-        specific = config.get("monitor_specific", [])
-        for service in specific:
-            issues.extend(self._check_service(service))
+        # Each call gets the same 5s limit as the systemctl probes (pydbus timeouts are in seconds,
+        # the GDBus default would be 25s)
+        # Units are (name, description, load, active, sub, followed, path, job_id, job_type, job_path)
+        if config.get("show_running_count", True):
+            stats.systemd_running = len(manager.ListUnitsByPatterns(["running"], ["*.service"], timeout=5))
+
+        if config.get("show_all_failed", True):
+            for unit in manager.ListUnitsByPatterns(["failed"], [], timeout=5):
+                issues.append(HealthIssue(
+                    severity=Severity.CRITICAL,
+                    category="systemd",
+                    name=unit[0],
+                    message=f"service {unit[4]}"
+                ))
+            stats.systemd_failed = len(issues)
+
+        # Check specific services if configured, skipping any already reported as failed
+        reported = {issue.name for issue in issues}
+        specific = []
+        for service_name in config.get("monitor_specific", ()):
+            # systemctl accepts bare names, the DBus API needs the unit suffix
+            unit_name = self._unit_name(service_name)
+            if unit_name not in reported:
+                specific.append((service_name, unit_name))
+
+        if specific:
+            units = manager.ListUnitsByNames([unit_name for _, unit_name in specific], timeout=5)
+            for (service_name, _), unit in zip(specific, units):
+                status = unit[3]
+                if status != "active":
+                    severity = Severity.WARNING if status == "inactive" else Severity.CRITICAL
+                    issues.append(HealthIssue(
+                        severity=severity,
+                        category="systemd",
+                        name=service_name,
+                        message=status
+                    ))
 
         return issues, stats
 
-    def _check_failed_services(self) -> List[HealthIssue]:
-        """Find all failed systemd services."""
+    @staticmethod
+    def _unit_name(name: str) -> str:
+        """Full unit name for a configured service, adding .service like systemctl does."""
+        return name if name.endswith(UNIT_SUFFIXES) else f"{name}.service"
+
+    def _check_systemctl(self, config: dict) -> tuple[List[HealthIssue], HealthStats]:
+        """Fallback to systemctl if DBus is unavailable."""
         issues = []
+        stats = HealthStats()
+
+        # One listing of every loaded unit answers the running count, failed units and specific services
+        active_states = {}
+        show_running_count = config.get("show_running_count", True)
+        show_all_failed = config.get("show_all_failed", True)
+        specific = config.get("monitor_specific", ())
+
+        if not (show_running_count or show_all_failed or specific):
+            # Nothing would use the unit listing, skip the fork
+            return issues, stats
+
         try:
-            result = subprocess.run(
-                ["systemctl", "--failed", "--no-legend", "--plain"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            for line in result.stdout.strip().split("\n"):
-                if not line:
+            for line in stream_command(["systemctl", "list-units", "--all", "--no-legend", "--plain"]):
+                # UNIT LOAD ACTIVE SUB DESCRIPTION, only the first four are needed
+                parts = line.split(None, 4)
+                if len(parts) < 4:
                     continue
-                parts = line.split()
-                if len(parts) >= 4:
-                    service_name = parts[0]
-                    state = parts[3]
+
+                unit, active, sub = parts[0], parts[2], parts[3]
+                active_states[unit] = active
+
+                if show_running_count and unit.endswith(".service") and sub == "running":
+                    stats.systemd_running += 1
+
+                if active == "failed" and show_all_failed:
                     issues.append(HealthIssue(
                         severity=Severity.CRITICAL,
                         category="systemd",
-                        name=service_name,
-                        message=f"service {state}"
+                        name=unit,
+                        message=f"service {sub}"
                     ))
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+                    stats.systemd_failed += 1
+        except subprocess.TimeoutExpired:
+            # A partial listing would report missing units as inactive, report nothing instead
+            self.cacheable = False
+            return [], HealthStats()
+        except subprocess.SubprocessError:
             pass
 
-        return issues
-
-    def _check_service(self, service_name: str) -> List[HealthIssue]:
-        """Check status of a specific service."""
-        issues = []
-        try:
-            result = subprocess.run(
-                ["systemctl", "is-active", service_name],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            status = result.stdout.strip()
+        # Check specific services if configured, skipping any already reported as failed
+        reported = {issue.name for issue in issues}
+        statuses = {}
+        unlisted = []
+        for service_name in specific:
+            unit_name = self._unit_name(service_name)
+            if unit_name in reported:
+                continue
+            if unit_name in active_states:
+                statuses[service_name] = active_states[unit_name]
+            else:
+                unlisted.append(service_name)
+
+        if unlisted:
+            # The listing only has canonical ids of loaded units; is-active also resolves aliases
+            # (e.g. sshd -> ssh.service) and prints one state per name, in order
+            try:
+                states = list(stream_command(["systemctl", "is-active", *unlisted]))
+                if len(states) == len(unlisted):
+                    statuses.update(zip(unlisted, states))
+            except subprocess.TimeoutExpired:
+                self.cacheable = False
+            except subprocess.SubprocessError:
+                pass
+
+        for service_name in specific:
+            # No status means already reported, or systemctl could not tell
+            status = statuses.get(service_name, "active")
             if status != "active":
                 severity = Severity.WARNING if status == "inactive" else Severity.CRITICAL
                 issues.append(HealthIssue(
@@ -152,15 +366,28 @@ class SystemdChecker(HealthChecker):
                     name=service_name,
                     message=status
                 ))
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-            pass
 
-        return issues
+        return issues, stats
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a UNIX socket, e.g. the Docker Engine API."""
+
+    def __init__(self, socket_path: str, timeout: float = 5):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
 
 
 class DockerChecker(HealthChecker):
     """Checks Docker container health."""
 
+    name = "docker"
+
     def check(self) -> tuple[List[HealthIssue], HealthStats]:
         config = self.config.get("docker", {})
         stats = HealthStats()
@@ -170,24 +397,37 @@ class DockerChecker(HealthChecker):
 
         issues = []
 
+        # Connects lazily on the first request
+        conn = UnixHTTPConnection(self._socket_path())
         try:
-            import docker
-            client = docker.from_env()
-            containers = client.containers.list(all=True)
+            containers = self._api_get(conn, "/containers/json?all=1")
 
-            ignore_list = set(config.get("ignore", []) or [])
+            # Normalized to a frozenset by load_config()
+            ignore_list = config.get("ignore") or frozenset()
+            show_running_count = config.get("show_running_count", True)
+            show_stopped = config.get("show_stopped", True)
+            show_unhealthy = config.get("show_unhealthy", True)
 
             for container in containers:
-                if container.name in ignore_list:
+                name = container["Names"][0].lstrip("/")
+                if name in ignore_list:
                     continue
 
-                # Check container status
-                status = container.status
-                health = container.attrs.get("State", {}).get("Health", {}).get("Status", "none")
+                # Check container status; only inspect when the status text hints at a failing health check
+                status = container["State"]
+                health = "none"
+                if "(unhealthy)" in container["Status"]:
+                    if show_unhealthy:
+                        state = self._api_get(conn, f"/containers/{container['Id']}/json").get("State") or {}
+                        health = (state.get("Health") or {}).get("Status", "none")
+                    else:
+                        # Not reported, the status text is good enough for the count
+                        health = "unhealthy"
 
                 # Count containers
                 if status == "running":
-                    stats.docker_running += 1
+                    if show_running_count:
+                        stats.docker_running += 1
                 elif status == "exited":
                     stats.docker_stopped += 1
 
@@ -195,83 +435,101 @@ class DockerChecker(HealthChecker):
                     stats.docker_unhealthy += 1
 
                 # Add issues
-                if status == "exited" and config.get("show_stopped", True):
+                if status == "exited" and show_stopped:
                     issues.append(HealthIssue(
                         severity=Severity.WARNING,
                         category="docker",
-                        name=container.name,
+                        name=name,
                         message=f"container stopped (exited)"
                     ))
                 elif status == "dead":
                     issues.append(HealthIssue(
                         severity=Severity.CRITICAL,
                         category="docker",
-                        name=container.name,
+                        name=name,
                         message="container dead"
                     ))
-                elif health == "unhealthy" and config.get("show_unhealthy", True):
+                elif health == "unhealthy" and show_unhealthy:
                     issues.append(HealthIssue(
                         severity=Severity.CRITICAL,
                         category="docker",
-                        name=container.name,
+                        name=name,
                         message="health check failed"
                     ))
                 elif status == "restarting":
                     issues.append(HealthIssue(
                         severity=Severity.WARNING,
                         category="docker",
-                        name=container.name,
+                        name=name,
                         message="container restarting"
                     ))
 
-        except ImportError:
-            # Docker library not available, try CLI
+        except OSError:
+            # Docker socket not reachable, try CLI
             issues, cli_stats = self._check_docker_cli(config)
             stats = cli_stats
         except Exception:
             # Docker not available or other error
             pass
+        finally:
+            conn.close()
 
         return issues, stats
 
+    @staticmethod
+    def _socket_path() -> str:
+        """Docker socket path, honouring a unix:// DOCKER_HOST like the docker CLI does."""
+        docker_host = os.environ.get("DOCKER_HOST", "")
+        if docker_host.startswith("unix://"):
+            return docker_host[len("unix://"):]
+        return DOCKER_SOCKET
+
+    @staticmethod
+    def _api_get(conn: http.client.HTTPConnection, path: str):
+        """GET a Docker Engine API endpoint and decode the JSON body."""
+        conn.request("GET", path)
+        response = conn.getresponse()
+        body = response.read()
+        if response.status != 200:
+            raise http.client.HTTPException(f"Docker API {path} returned {response.status}")
+        return json.loads(body)
+
     def _check_docker_cli(self, config: dict) -> tuple[List[HealthIssue], HealthStats]:
-        """Fallback to Docker CLI if Python library unavailable."""
+        """Fallback to Docker CLI if the Docker socket is unavailable."""
         issues = []
         stats = HealthStats()
         try:
-            result = subprocess.run(
-                ["docker", "ps", "-a", "--format", "{{.Names}}\t{{.Status}}\t{{.State}}"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            # Normalized to a frozenset by load_config()
+            ignore_list = config.get("ignore") or frozenset()
+            show_running_count = config.get("show_running_count", True)
+            show_stopped = config.get("show_stopped", True)
+            show_unhealthy = config.get("show_unhealthy", True)
 
-            ignore_list = set(config.get("ignore", []) or [])
-
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-
-                parts = line.split("\t")
-                if len(parts) < 3:
-                    continue
+            # One JSON object per line, joined into a single array so it is parsed in one call
+            lines = list(stream_command(["docker", "ps", "-a", "--format", "{{json .}}"]))
+            entries = json.loads("[" + ",".join(lines) + "]")
 
-                name, status, state = parts[0], parts[1], parts[2]
+            for entry in entries:
+                name, status, state = entry["Names"], entry["Status"], entry["State"]
 
                 if name in ignore_list:
                     continue
 
+                # Docker appends a literal "(unhealthy)" to the status of failing healthchecks
+                is_unhealthy = "(unhealthy)" in status
+
                 # Count containers
                 if state == "running":
-                    stats.docker_running += 1
+                    if show_running_count:
+                        stats.docker_running += 1
                 elif state == "exited":
                     stats.docker_stopped += 1
 
-                if "unhealthy" in status.lower():
+                if is_unhealthy:
                     stats.docker_unhealthy += 1
 
                 # Add issues
-                if state == "exited" and config.get("show_stopped", True):
+                if state == "exited" and show_stopped:
                     issues.append(HealthIssue(
                         severity=Severity.WARNING,
                         category="docker",
@@ -285,7 +543,7 @@ class DockerChecker(HealthChecker):
                         name=name,
                         message="container dead"
                     ))
-                elif "unhealthy" in status.lower() and config.get("show_unhealthy", True):
+                elif is_unhealthy and show_unhealthy:
                     issues.append(HealthIssue(
                         severity=Severity.CRITICAL,
                         category="docker",
@@ -300,12 +558,39 @@ class DockerChecker(HealthChecker):
                         message="container restarting"
                     ))
 
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
+        except subprocess.TimeoutExpired:
+            self.cacheable = False
+        except (subprocess.SubprocessError, FileNotFoundError, ValueError, KeyError):
             pass
 
         return issues, stats
 
 
+@functools.lru_cache(maxsize=4)
+def _read_config_raw(path_str: str, mtime_ns: int) -> dict:
+    """Parse a YAML config file; mtime_ns is only part of the cache key so edits invalidate it."""
+    # Imported here so runs without a config file never pay for PyYAML
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    with open(path_str) as f:
+        return _normalize_config(yaml.load(f, Loader=SafeLoader) or {})
+
+
+def _normalize_config(config: dict) -> dict:
+    """Dedupe monitored services and freeze the docker ignore list once, not on every check."""
+    systemd = config["systemd"] = config.get("systemd") or {}
+    systemd["monitor_specific"] = tuple(dict.fromkeys(systemd.get("monitor_specific") or ()))
+
+    docker = config["docker"] = config.get("docker") or {}
+    docker["ignore"] = frozenset(docker.get("ignore") or ())
+
+    return config
+
+
 def load_config(config_path: Optional[Path] = None) -> dict:
     """Load configuration from YAML file."""
     if config_path is None:
@@ -322,89 +607,279 @@ def load_config(config_path: Optional[Path] = None) -> dict:
                 break
 
     if config_path and config_path.exists():
-        with open(config_path) as f:
-            return yaml.safe_load(f) or {}
+        return _read_config_raw(str(config_path), config_path.stat().st_mtime_ns)
 
     # Default config if no file found
-    return {
+    return _normalize_config({
         "systemd": {"show_all_failed": True},
         "docker": {"enabled": True, "show_stopped": True, "show_unhealthy": True},
         "display": {"show_ok_status": False, "max_items": 10}
+    })
+
+
+def load_cache() -> dict:
+    """Read the per-checker result cache, empty if missing, unreadable or not ours."""
+    try:
+        # Non-blocking so a planted FIFO can't hang the login, no symlinks into other files
+        fd = os.open(CACHE_PATH, os.O_RDONLY | os.O_NONBLOCK | os.O_NOFOLLOW)
+        with os.fdopen(fd, "rb") as f:
+            # The temp dir is shared, only trust a regular file this user wrote
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode) or st.st_uid != os.getuid():
+                return {}
+            cache = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def cached_result(cache: dict, name: str, ttl: float) -> Optional[tuple[List[HealthIssue], HealthStats]]:
+    """Return a checker's cached issues and stats if its slot is still fresh."""
+    try:
+        entry = cache[name]
+        age = time.time() - entry["ts"]
+        if age < 0 or age >= ttl:
+            # Expired, or written with a timestamp from the future
+            return None
+        issues = [HealthIssue.from_dict(item) for item in entry["issues"]]
+        return issues, HealthStats(**entry["stats"])
+    except (ValueError, KeyError, TypeError):
+        # Missing or malformed slot - just run the checker
+        return None
+
+
+def cache_entry(issues: List[HealthIssue], stats: HealthStats) -> dict:
+    """Serialize one checker's result for the cache file."""
+    return {
+        "ts": time.time(),
+        "issues": [issue.to_dict() for issue in issues],
+        "stats": asdict(stats),
     }
 
 
+def save_cache(cache: dict):
+    """Atomically write the per-checker result cache."""
+    tmp_path = None
+    try:
+        # mkstemp creates an unpredictable, private (0600) file, so nothing can be planted in its place
+        fd, tmp_name = tempfile.mkstemp(prefix=f"{CACHE_PATH.name}.", suffix=".tmp", dir=CACHE_PATH.parent)
+        tmp_path = Path(tmp_name)
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(cache))
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        # Caching is best-effort, never fail the health check over it
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
+def run_checks(config: dict, use_cache: bool = True) -> tuple[List[HealthIssue], HealthStats]:
+    """Run all checkers (reusing fresh cached results) and merge their issues and stats."""
+    # Initialize checkers
+    checkers = [
+        SystemdChecker(config),
+        DockerChecker(config),
+    ]
+
+    # Reuse every checker result that is still within its TTL
+    cache = load_cache() if use_cache else {}
+    results = [cached_result(cache, checker.name, checker.ttl) for checker in checkers]
+    stale = [checker for checker, result in zip(checkers, results) if result is None]
+
+    if stale:
+        # Checkers are I/O-bound (subprocess/Docker API), so run them in parallel
+        with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+            fresh = dict(zip(stale, executor.map(lambda c: c.check(), stale)))
+
+        results = [fresh.get(checker, result) for checker, result in zip(checkers, results)]
+
+        # Only the slots of checkers that ran are refreshed, results of timed out probes are dropped
+        new_cache = {}
+        for checker in checkers:
+            if checker not in fresh:
+                new_cache[checker.name] = cache[checker.name]
+            elif checker.cacheable:
+                new_cache[checker.name] = cache_entry(*fresh[checker])
+        save_cache(new_cache)
+
+    # Collect all issues and aggregate stats
+    all_issues = list(itertools.chain.from_iterable(issues for issues, _ in results))
+    combined_stats = HealthStats()
+
+    for _, stats in results:
+        # Merge stats
+        combined_stats.systemd_running += stats.systemd_running
+        combined_stats.systemd_failed += stats.systemd_failed
+        combined_stats.docker_running += stats.docker_running
+        combined_stats.docker_stopped += stats.docker_stopped
+        combined_stats.docker_unhealthy += stats.docker_unhealthy
+
+    return all_issues, combined_stats
+
+
+def render_output(display_config: dict, all_issues: List[HealthIssue], combined_stats: HealthStats) -> bytes:
+    """Render the summary and issue lines as UTF-8 encoded terminal output."""
+    # Build summary parts
+    summary_parts = []
+
+    if combined_stats.systemd_running > 0:
+        summary_parts.append(f"{combined_stats.systemd_running} services")
+
+    if combined_stats.docker_running > 0:
+        summary_parts.append(f"{combined_stats.docker_running} containers")
+
+    # Collect encoded output lines, joined in one go at the end
+    lines = []
+
+    # Display summary
+    if summary_parts:
+        summary_text = " • ".join(summary_parts)
+
+        if not all_issues:
+            # All healthy
+            lines.append(f"\033[38;5;248m✓ {summary_text} running\033[0m\n".encode("utf-8"))
+        else:
+            # Has issues - show summary with issue count
+            issue_count = len(all_issues)
+            issue_word = "issue" if issue_count == 1 else "issues"
+            lines.append(f"\033[38;5;248m{summary_text} • {_WARN_C}{issue_count} {issue_word}{_WARN_R}\n".encode("utf-8"))
+
+    # Show issues if any
+    if all_issues:
+        # Pick the most severe issues up to the output limit (stable, like sort+slice)
+        max_items = display_config.get("max_items", 10)
+        displayed_issues = heapq.nsmallest(max_items, all_issues, key=operator.attrgetter("severity"))
+
+        lines.extend(issue.format_bytes() for issue in displayed_issues)
+
+        # Show truncation notice if needed
+        if len(all_issues) > max_items:
+            remaining = len(all_issues) - max_items
+            lines.append(f"{_INFO_C}... and {remaining} more issue(s){_INFO_R}\n".encode("utf-8"))
+
+    return b"".join(lines)
+
+
+def check_once(use_cache: bool = True) -> bytes:
+    """Load the config, run the checks and render their output."""
+    config = load_config()
+    all_issues, combined_stats = run_checks(config, use_cache)
+    return render_output(config.get("display", {}), all_issues, combined_stats)
+
+
+def read_daemon(socket_path: Path, trusted_uids: set) -> Optional[bytes]:
+    """Fetch the latest output from a running --daemon, None if there is none or it is not trusted."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1)
+            sock.connect(str(socket_path))
+
+            # The fallback path is in a shared temp dir, so check who is actually on the other end
+            creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+            _, peer_uid, _ = struct.unpack("3i", creds)
+            if peer_uid not in trusted_uids:
+                return None
+
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except (OSError, AttributeError):
+        # No daemon listening, or no SO_PEERCRED on this platform
+        return None
+    return b"".join(chunks)
+
+
+def serve(socket_path: Path, interval: float) -> int:
+    """Re-run the checks every interval seconds and hand the latest output to every connection."""
+    # Only replace a socket left behind by one of our own previous runs
+    try:
+        existing = socket_path.lstat()
+    except FileNotFoundError:
+        existing = None
+    if existing is not None:
+        if not stat.S_ISSOCK(existing.st_mode) or existing.st_uid != os.getuid():
+            print(f"{_WARN_C}⚠ {socket_path} exists and is not our socket{_WARN_R}", file=sys.stderr)
+            return 1
+        socket_path.unlink()
+
+    def run():
+        try:
+            return check_once(use_cache=False)
+        except Exception as e:
+            # Keep serving, but make the failure (e.g. a config typo) visible on the next login
+            return f"{_WARN_C}⚠ Health check error: {str(e)}{_WARN_R}\n".encode("utf-8")
+
+    output = run()
+
+    def refresh():
+        nonlocal output
+        while True:
+            time.sleep(interval)
+            output = run()
+
+    threading.Thread(target=refresh, daemon=True).start()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        # Create the socket file private (0600) from the start, not chmod-ed after the fact
+        old_umask = os.umask(0o077)
+        try:
+            server.bind(str(socket_path))
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    conn.sendall(output)
+                except OSError:
+                    pass
+
+
 def main():
     """Main entry point."""
-    try:
-        config = load_config()
-        display_config = config.get("display", {})
+    parser = argparse.ArgumentParser(description="Homelab health checker")
+    parser.add_argument("--no-cache", action="store_true", help="ignore cached results and re-run all checks")
+    parser.add_argument("--daemon", action="store_true", help="keep running and serve results over a UNIX socket")
+    parser.add_argument("--interval", type=float, default=DAEMON_INTERVAL, help="seconds between checks in daemon mode")
+    parser.add_argument("--socket", type=Path, help=f"daemon socket path (default: {DAEMON_SOCKET})")
+    args = parser.parse_args()
 
-        # Initialize checkers
-        checkers = [
-            SystemdChecker(config),
-            DockerChecker(config),
-        ]
+    socket_path = args.socket or DAEMON_SOCKET
 
-        # Collect all issues and aggregate stats
-        all_issues = []
-        combined_stats = HealthStats()
+    if args.daemon:
+        return serve(socket_path, args.interval)
 
-        for checker in checkers:
-            issues, stats = checker.check()
-            all_issues.extend(issues)
-            # Merge stats
-            combined_stats.systemd_running += stats.systemd_running
-            combined_stats.systemd_failed += stats.systemd_failed
-            combined_stats.docker_running += stats.docker_running
-            combined_stats.docker_stopped += stats.docker_stopped
-            combined_stats.docker_unhealthy += stats.docker_unhealthy
-
-        # Build summary parts
-        summary_parts = []
-
-        if combined_stats.systemd_running > 0:
-            summary_parts.append(f"{combined_stats.systemd_running} services")
-
-        if combined_stats.docker_running > 0:
-            summary_parts.append(f"{combined_stats.docker_running} containers")
-
-        # Display summary
-        if summary_parts:
-            summary_text = " • ".join(summary_parts)
-
-            if not all_issues:
-                # All healthy
-                print(f"\033[38;5;248m✓ {summary_text} running\033[0m")
-            else:
-                # Has issues - show summary with issue count
-                issue_count = len(all_issues)
-                issue_word = "issue" if issue_count == 1 else "issues"
-                print(f"\033[38;5;248m{summary_text} • {Severity.WARNING.color}{issue_count} {issue_word}{Severity.WARNING.reset}")
-
-        # Show issues if any
-        if all_issues:
-            # Sort by severity (critical first)
-            severity_order = {Severity.CRITICAL: 0, Severity.WARNING: 1, Severity.INFO: 2, Severity.OK: 3}
-            all_issues.sort(key=lambda x: severity_order.get(x.severity, 99))
-
-            # Limit output
-            max_items = display_config.get("max_items", 10)
-            displayed_issues = all_issues[:max_items]
-
-            # Print issues
-            for issue in displayed_issues:
-                print(issue.format())
-
-            # Show truncation notice if needed
-            if len(all_issues) > max_items:
-                remaining = len(all_issues) - max_items
-                print(f"{Severity.INFO.color}... and {remaining} more issue(s){Severity.INFO.reset}")
+    try:
+        # Trust daemons of our own uid, plus the owner of an explicitly passed --socket
+        trusted_uids = {os.getuid()}
+        if args.socket is not None:
+            try:
+                trusted_uids.add(args.socket.stat().st_uid)
+            except OSError:
+                pass
+
+        # A running daemon already has fresh results, fall back to checking directly
+        output = None if args.no_cache else read_daemon(socket_path, trusted_uids)
+        if output is None:
+            output = check_once(use_cache=not args.no_cache)
+
+        if output:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(output)
+            sys.stdout.buffer.flush()
 
         return 0
 
     except Exception as e:
         # Fail gracefully - don't break login
-        print(f"{Severity.WARNING.color}⚠ Health check error: {str(e)}{Severity.WARNING.reset}", file=sys.stderr)
+        print(f"{_WARN_C}⚠ Health check error: {str(e)}{_WARN_R}", file=sys.stderr)
         return 1
 
 
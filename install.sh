@@ -16,7 +16,7 @@ python3 -m venv "$VENV_PATH"
 
 # Install dependencies
 echo "Installing dependencies..."
-"$VENV_PATH/bin/pip" install -q pyyaml docker
+"$VENV_PATH/bin/pip" install -q pyyaml
 
 # Update shebang to use venv python
 echo "Updating script shebang..."
@@ -45,4 +45,9 @@ echo "EOF"
 echo ""
 echo "   sudo chmod +x /etc/update-motd.d/89-health-check"
 echo ""
-echo "3. Customize monitoring in: $SCRIPT_DIR/config.yaml"
+echo "3. Optionally run it as a daemon for faster logins:"
+echo "   mkdir -p ~/.config/systemd/user"
+echo "   sed \"s|%h/code/homelab-health|$SCRIPT_DIR|g\" $SCRIPT_DIR/homelab-health.service > ~/.config/systemd/user/homelab-health.service"
+echo "   systemctl --user enable --now homelab-health"
+echo ""
+echo "4. Customize monitoring in: $SCRIPT_DIR/config.yaml"